@@ -1,6 +1,4 @@
 from logging.config import fileConfig
-from sqlalchemy import engine_from_config
-from sqlalchemy import pool
 from alembic import context
 import os
 import sys
@@ -8,9 +6,7 @@ import sys
 # Add the app directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.db.database import Base
-from app.db.models import *
-from app.core.config import settings
+from app.db.database import Base, DB_URL, get_engine
 
 config = context.config
 
@@ -19,20 +15,15 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+def _load_models() -> None:
+    """Import the models so they register on Base.metadata before migrating"""
+    import app.db.models  # noqa: F401
+
 def get_url():
-    database_url = settings.DATABASE_URL
-    original_url = database_url
-    if database_url.startswith("postgresql://"):
-        database_url = database_url.replace("postgresql://", "postgresql+psycopg://", 1)
-        print(f"🔧 Using PostgreSQL configuration with psycopg3 driver")
-        print(f"🔄 Converted URL from: {original_url}")
-        print(f"🔗 Final database URL: {database_url}")
-    else:
-        print(f"🔧 Using PostgreSQL configuration")
-        print(f"🔗 Final database URL: {database_url}")
-    return database_url
+    return DB_URL
 
 def run_migrations_offline() -> None:
+    _load_models()
     url = get_url()
     context.configure(
         url=url,
@@ -45,13 +36,9 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 def run_migrations_online() -> None:
-    configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = get_url()
-    connectable = engine_from_config(
-        configuration,
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    _load_models()
+    # Share the application's engine so a process holds a single pool
+    connectable = get_engine()
 
     with connectable.connect() as connection:
         context.configure(
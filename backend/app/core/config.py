@@ -1,50 +1,93 @@
 import os
-from typing import List
-from dotenv import load_dotenv
+import re
+from functools import lru_cache
+from typing import Pattern, Tuple
 
-load_dotenv()
+# Production gets its environment from the platform, so only parse .env locally
+if os.getenv("ENVIRONMENT") != "production":
+    from dotenv import find_dotenv, load_dotenv
+
+    # Search upward from this module, as load_dotenv() itself does
+    _dotenv_path = find_dotenv()
+    if _dotenv_path:
+        load_dotenv(_dotenv_path)
+
+DEFAULT_ALLOWED_ORIGINS = (
+    "http://localhost:3000",
+    "http://localhost:5173",
+    "http://localhost:8080",
+)
 
 class Settings:
-    PROJECT_NAME: str = "Starter Web App"
-    VERSION: str = "1.0.0"
-    
-    # CORS settings
-    ALLOWED_ORIGINS: List[str] = [
-        "http://localhost:3000",
-        "http://localhost:5173",
-        "http://localhost:8080",
-    ]
-    
-    # Database
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./app.db")
-    
-    # Environment
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
-    DEBUG: bool = os.getenv("DEBUG", "true").lower() == "true"
+    __slots__ = (
+        "PROJECT_NAME",
+        "VERSION",
+        "DATABASE_URL",
+        "POOL_SIZE",
+        "MAX_OVERFLOW",
+        "POOL_TIMEOUT",
+        "POOL_RECYCLE",
+        "ENVIRONMENT",
+        "DEBUG",
+        "ALLOWED_ORIGINS",
+        "ALLOWED_ORIGIN_REGEX",
+    )
 
     def __init__(self):
+        self.PROJECT_NAME: str = "Starter Web App"
+        self.VERSION: str = "1.0.0"
+
+        # Read each environment variable exactly once
+        database_url = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+        environment = os.getenv("ENVIRONMENT", "development")
+        debug = os.getenv("DEBUG", "true").lower() == "true"
+
+        # Database
+        self.DATABASE_URL: str = database_url
+
+        # Database connection pool (PostgreSQL)
+        self.POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 30))
+        self.MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 40))
+        self.POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", 30))
+        self.POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 3600))
+
+        # Environment
+        self.ENVIRONMENT: str = environment
+        self.DEBUG: bool = debug
+
+        # CORS settings
+        origins = list(DEFAULT_ALLOWED_ORIGINS)
+
         # Add production origins if in production
-        if self.ENVIRONMENT == "production":
+        if environment == "production":
             production_origin = os.getenv("FRONTEND_URL")
             if production_origin:
                 # Normalize URL - remove trailing slash and add both versions
                 normalized_url = production_origin.rstrip('/')
-                self.ALLOWED_ORIGINS.extend([
+                origins.extend([
                     normalized_url,           # without trailing slash
                     normalized_url + '/'      # with trailing slash
                 ])
-            
+
             # Also check for specific Cloudflare URL
             cloudflare_url = os.getenv("CLOUDFLARE_WORKERS_URL")
             if cloudflare_url:
                 normalized_cf_url = cloudflare_url.rstrip('/')
-                self.ALLOWED_ORIGINS.extend([
+                origins.extend([
                     normalized_cf_url,        # without trailing slash
                     normalized_cf_url + '/'   # with trailing slash
                 ])
-        
-        # Remove duplicates and print for debugging
-        self.ALLOWED_ORIGINS = list(set(self.ALLOWED_ORIGINS))
-        print(f"🔗 CORS Allowed Origins: {self.ALLOWED_ORIGINS}")
 
-settings = Settings()
\ No newline at end of file
+        # Remove duplicates while keeping the configured order
+        self.ALLOWED_ORIGINS: Tuple[str, ...] = tuple(dict.fromkeys(origins))
+        # Anchored alternation of the exact origins for CORSMiddleware's regex matcher
+        self.ALLOWED_ORIGIN_REGEX: Pattern[str] = re.compile(
+            "^(" + "|".join(map(re.escape, self.ALLOWED_ORIGINS)) + ")$"
+        )
+        if debug:
+            print(f"🔗 CORS Allowed Origins: {list(self.ALLOWED_ORIGINS)}")
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, built on first use"""
+    return Settings()
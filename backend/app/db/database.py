@@ -1,63 +1,92 @@
+import logging
+from functools import lru_cache
+from urllib.parse import urlparse
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+from app.core.config import get_settings
 
-def get_engine():
-    """Create database engine with appropriate configuration"""
-    print(f"🔍 Original DATABASE_URL: {settings.DATABASE_URL}")
-    
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+def _normalize_db_url(url: str) -> str:
+    """Convert postgresql:// to postgresql+psycopg:// for the psycopg3 driver"""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+psycopg://", 1)
+    return url
+
+def _async_db_url(url: str) -> str:
+    """Select the asyncio driver for the given driver-qualified URL"""
+    # psycopg3 serves both sync and async engines; SQLite needs aiosqlite
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+# Driver-qualified URLs, computed once at import
+DB_URL = _normalize_db_url(settings.DATABASE_URL)
+ASYNC_DB_URL = _async_db_url(DB_URL)
+
+# Database type without the driver suffix, e.g. "postgresql" for postgresql+psycopg
+DB_SCHEME = urlparse(DB_URL).scheme.split("+")[0]
+
+# The sync engine only serves alembic and get_db, so it keeps a minimal pool;
+# API traffic goes through the async engine, which gets the configured sizes
+SYNC_POOL_SIZE = 1
+SYNC_MAX_OVERFLOW = 2
+
+def _engine_options(pool_size: int, max_overflow: int) -> dict:
+    """Engine keyword arguments for the configured database type"""
     # Configure engine based on database type
-    if "sqlite" in settings.DATABASE_URL:
+    if DB_SCHEME == "sqlite":
         # SQLite configuration for development
-        print(f"🔧 Using SQLite configuration")
-        print(f"🔗 Final database URL: {settings.DATABASE_URL}")
-        return create_engine(
-            settings.DATABASE_URL,
-            connect_args={"check_same_thread": False}
-        )
-    elif "postgresql" in settings.DATABASE_URL:
+        logger.info("🔧 Using SQLite configuration")
+        return {"connect_args": {"check_same_thread": False}}
+    elif DB_SCHEME == "postgresql":
         # PostgreSQL configuration for production
-        # Convert postgresql:// to postgresql+psycopg:// for psycopg3 driver
-        database_url = settings.DATABASE_URL
-        original_url = database_url
-        if database_url.startswith("postgresql://"):
-            database_url = database_url.replace("postgresql://", "postgresql+psycopg://", 1)
-            print(f"🔧 Using PostgreSQL configuration with psycopg3 driver")
-            print(f"🔄 Converted URL from: {original_url}")
-            print(f"🔗 Final database URL: {database_url}")
-        else:
-            print(f"🔧 Using PostgreSQL configuration")
-            print(f"🔗 Final database URL: {database_url}")
-        
-        return create_engine(
-            database_url,
-            pool_pre_ping=True,
-            pool_recycle=300,
-            pool_size=10,
-            max_overflow=20
-        )
+        logger.info("🔧 Using PostgreSQL configuration")
+        return {
+            "pool_pre_ping": True,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": settings.POOL_TIMEOUT,
+            "pool_recycle": settings.POOL_RECYCLE,
+        }
     else:
         # Fallback configuration
-        print(f"🔧 Using fallback configuration")
-        print(f"🔗 Final database URL: {settings.DATABASE_URL}")
-        return create_engine(settings.DATABASE_URL)
+        logger.info("🔧 Using fallback configuration")
+        return {}
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """Create database engine with appropriate configuration on first use"""
+    return create_engine(
+        DB_URL, **_engine_options(SYNC_POOL_SIZE, SYNC_MAX_OVERFLOW)
+    )
 
-# Create engine lazily
-engine = get_engine()
+@lru_cache(maxsize=1)
+def get_async_engine():
+    """Create asyncio database engine with appropriate configuration on first use"""
+    return create_async_engine(
+        ASYNC_DB_URL, **_engine_options(settings.POOL_SIZE, settings.MAX_OVERFLOW)
+    )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Session factories are bound to the engines when a session is opened
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
 def get_db():
     """Dependency to get database session"""
-    db = SessionLocal()
-    try:
+    with SessionLocal(bind=get_engine()) as db:
+        yield db
+
+async def get_async_db():
+    """Dependency to get an asyncio database session"""
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
         yield db
-    finally:
-        db.close()
 
 def create_tables():
     """Create all tables in the database"""
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=get_engine())
@@ -1,52 +1,113 @@
-from fastapi import FastAPI, Depends, Request
+import logging
+import orjson
+from typing import Optional
+from fastapi import FastAPI, Depends, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from sqlalchemy.orm import Session
-from app.core.config import settings
-from app.db.database import get_db
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import get_settings
+from app.db.database import get_async_db, get_async_engine
 from app.db.models import User
 
-app = FastAPI(title="Starter Web App API", version="1.0.0")
-
-class CORSDebugMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        origin = request.headers.get("origin")
-        if origin:
-            print(f"🌐 CORS Request from origin: '{origin}'")
-            print(f"🔍 Allowed origins: {settings.ALLOWED_ORIGINS}")
-            if origin in settings.ALLOWED_ORIGINS:
-                print(f"✅ Origin '{origin}' is allowed")
-            else:
-                print(f"❌ Origin '{origin}' is NOT in allowed list")
-        
-        response = await call_next(request)
-        return response
-
-# Add CORS debugging middleware first
-app.add_middleware(CORSDebugMiddleware)
+settings = get_settings()
+
+# Give the app's own loggers a handler without touching the root logger
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(levelname)s:     %(name)s - %(message)s")
+)
+for _name, _level in (
+    # CORS diagnostics are emitted at DEBUG level and only shown in debug mode
+    ("cors", logging.DEBUG if settings.DEBUG else logging.WARNING),
+    # Engine setup messages from app.db.database
+    ("app.db.database", logging.INFO),
+):
+    _log = logging.getLogger(_name)
+    _log.addHandler(_log_handler)
+    _log.setLevel(_level)
+    _log.propagate = False
+
+logger = logging.getLogger("cors")
+
+# Hashed allow-list so origin checks are O(1) per request
+_ALLOWED = frozenset(settings.ALLOWED_ORIGINS)
+
+app = FastAPI(
+    title="Starter Web App API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+class CORSDebugMiddleware:
+    """Pure ASGI middleware that logs the Origin of each HTTP request"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            # Scan the raw header pairs rather than building a Headers mapping
+            for name, value in scope["headers"]:
+                if name == b"origin":
+                    origin = value.decode("latin-1")
+                    logger.debug(
+                        "CORS origin=%s allowed=%s", origin, origin in _ALLOWED
+                    )
+                    break
+
+        await self.app(scope, receive, send)
+
+# Compress larger responses such as /api/users pages
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Add CORS debugging middleware (debug only, so production skips the extra hop)
+if settings.DEBUG:
+    app.add_middleware(CORSDebugMiddleware)
 
 # Then add the actual CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
+    allow_origin_regex=settings.ALLOWED_ORIGIN_REGEX.pattern,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Static response bodies, encoded once at import
+_ROOT_BODY = orjson.dumps({"message": "Hello from FastAPI"})
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+_HELLO_BODY = orjson.dumps({"message": "Hello from API"})
+
 @app.get("/")
-def read_root():
-    return {"message": "Hello from FastAPI"}
+async def read_root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
-def health_check():
-    return {"status": "healthy"}
+async def health_check():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+@app.get("/health/pool")
+async def pool_status():
+    # The async engine's pool is the one serving API requests
+    return {"pool": get_async_engine().pool.status()}
 
 @app.get("/api/hello")
-def api_hello():
-    return {"message": "Hello from API"}
+async def api_hello():
+    return Response(content=_HELLO_BODY, media_type="application/json")
 
 @app.get("/api/users")
-def get_users(db: Session = Depends(get_db)):
-    users = db.query(User).all()
-    return users
\ No newline at end of file
+async def get_users(
+    limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    # Keyset pagination: pass the last id of a page as after_id to fetch the next
+    # Select only the public columns as plain rows, skipping ORM hydration
+    query = select(User.id, User.email, User.name)
+    if after_id is not None:
+        query = query.where(User.id > after_id)
+    result = await db.execute(query.order_by(User.id).limit(limit))
+    return [{"id": row.id, "email": row.email, "name": row.name} for row in result]
@@ -8,6 +8,7 @@ project names, configurations, and automatic setup.
 Usage:
     python scaffold.py
     python scaffold.py --name my-app --description "My awesome app"
+    python scaffold.py --batch projects.json
     python scaffold.py --help
 """
 
@@ -18,8 +19,20 @@ import argparse
 import subprocess
 import json
 import re
+import shlex
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional, Tuple, Union
+
+# Optional C extension for multi-token replacement (pip install pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+DEFAULT_DESCRIPTION = 'A full-stack web application built with FastAPI and React'
 
 # Colors for console output
 class Colors:
@@ -37,181 +50,61 @@ def log(message: str, color: str = Colors.RESET) -> None:
     """Print colored log message"""
     print(f"{color}{message}{Colors.RESET}")
 
-def run_command(command: str, cwd: Optional[str] = None, check: bool = True) -> bool:
-    """Run a shell command and return success status"""
+def run_command(
+    command: Union[List[str], str],
+    cwd: Optional[str] = None,
+    check: bool = True,
+    capture: bool = True
+) -> bool:
+    """Run a command without a shell and return success status
+    
+    With capture=False the command inherits stdout/stderr, so long-running
+    installs stream their progress instead of being buffered in memory.
+    """
+    if isinstance(command, str):
+        command = shlex.split(command)
     try:
         result = subprocess.run(
             command, 
-            shell=True, 
             cwd=cwd, 
             check=check,
-            capture_output=True, 
+            capture_output=capture, 
             text=True
         )
-        return True
+        return result.returncode == 0
     except subprocess.CalledProcessError as e:
-        log(f"❌ Command failed: {command}", Colors.RED)
+        log(f"❌ Command failed: {shlex.join(command)}", Colors.RED)
         if e.stdout:
             log(f"STDOUT: {e.stdout}", Colors.YELLOW)
         if e.stderr:
             log(f"STDERR: {e.stderr}", Colors.YELLOW)
         return False
+    except OSError as e:
+        log(f"❌ Could not run {command[0]}: {e}", Colors.RED)
+        return False
+
+# Project name patterns, compiled once
+# Must be lowercase, can contain hyphens and underscores
+_NAME_RE = re.compile(r'^[a-z][a-z0-9\-_]*[a-z0-9]$')
+_SANITIZE_BAD = re.compile(r'[^a-z0-9\-_]')
+_SANITIZE_DASHES = re.compile(r'-+')
 
 def validate_project_name(name: str) -> bool:
     """Validate project name follows conventions"""
-    # Must be lowercase, can contain hyphens and underscores
-    pattern = r'^[a-z][a-z0-9\-_]*[a-z0-9]$'
-    return bool(re.match(pattern, name)) and len(name) >= 2
+    return _NAME_RE.match(name) is not None and len(name) >= 2
 
 def sanitize_name(name: str) -> str:
     """Convert name to valid project name format"""
     # Convert to lowercase, replace spaces and special chars with hyphens
-    sanitized = re.sub(r'[^a-z0-9\-_]', '-', name.lower())
+    sanitized = _SANITIZE_BAD.sub('-', name.lower())
     # Remove multiple consecutive hyphens
-    sanitized = re.sub(r'-+', '-', sanitized)
+    sanitized = _SANITIZE_DASHES.sub('-', sanitized)
     # Remove leading/trailing hyphens
     sanitized = sanitized.strip('-_')
     return sanitized
 
-class ProjectScaffolder:
-    """Main scaffolding class"""
-    
-    def __init__(self, project_name: str, description: str, target_dir: str):
-        self.project_name = project_name
-        self.description = description
-        self.target_dir = Path(target_dir).resolve()
-        self.template_dir = Path(__file__).parent.resolve()
-        
-        # Derived names
-        self.snake_case_name = project_name.replace('-', '_')
-        self.title_case_name = project_name.replace('-', ' ').replace('_', ' ').title()
-        self.camel_case_name = ''.join(word.capitalize() for word in project_name.replace('-', '_').split('_'))
-        
-        # Files and directories to exclude from copying
-        self.exclude_patterns = {
-            '__pycache__',
-            '*.pyc',
-            '*.pyo',
-            '.git',
-            '.gitignore',
-            'venv',
-            'node_modules',
-            '.env',
-            '*.db',
-            'dist',
-            '.vite',
-            'temp.tmp',
-            'scaffold.py',  # Don't copy the scaffold script itself
-        }
-        
-        # Files that need content replacement
-        self.template_files = [
-            'README.md',
-            'package.json',
-            'backend/requirements.txt',
-            'backend/render.yaml',
-            'frontend/package.json',
-            'frontend/wrangler.toml',
-            'frontend/index.html',
-            'frontend/src/App.jsx',
-            'backend/.env.example',
-            'frontend/.env.example',
-        ]
-
-    def should_exclude(self, path: Path) -> bool:
-        """Check if a file/directory should be excluded"""
-        for pattern in self.exclude_patterns:
-            if pattern.startswith('*'):
-                if path.name.endswith(pattern[1:]):
-                    return True
-            elif path.name == pattern:
-                return True
-        return False
-
-    def copy_template_structure(self) -> bool:
-        """Copy the template directory structure to target location"""
-        log(f"📁 Copying template structure to {self.target_dir}", Colors.BLUE)
-        
-        try:
-            for root, dirs, files in os.walk(self.template_dir):
-                # Remove excluded directories from dirs list (modifies in-place)
-                dirs[:] = [d for d in dirs if not self.should_exclude(Path(root) / d)]
-                
-                for file in files:
-                    src_path = Path(root) / file
-                    
-                    # Skip excluded files
-                    if self.should_exclude(src_path):
-                        continue
-                    
-                    # Calculate relative path from template root
-                    rel_path = src_path.relative_to(self.template_dir)
-                    dest_path = self.target_dir / rel_path
-                    
-                    # Create directory if it doesn't exist
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Copy file
-                    shutil.copy2(src_path, dest_path)
-            
-            log("✅ Template structure copied successfully", Colors.GREEN)
-            return True
-            
-        except Exception as e:
-            log(f"❌ Failed to copy template structure: {e}", Colors.RED)
-            return False
-
-    def update_file_contents(self) -> bool:
-        """Update template files with project-specific content"""
-        log("📝 Updating file contents with project information", Colors.BLUE)
-        
-        replacements = {
-            'starter-webapp': self.project_name,
-            'starter_webapp': self.snake_case_name,
-            'Starter Web App': self.title_case_name,
-            'Full-stack template with FastAPI + React': self.description,
-            'starter-webapp-frontend': f"{self.project_name}-frontend",
-            'starter-webapp-backend': f"{self.project_name}-backend",
-            'starter-webapp-db': f"{self.project_name}-db",
-        }
-        
-        try:
-            for template_file in self.template_files:
-                file_path = self.target_dir / template_file
-                
-                if not file_path.exists():
-                    continue
-                
-                # Read file content
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Apply replacements
-                for old, new in replacements.items():
-                    content = content.replace(old, new)
-                
-                # Write updated content
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-            
-            log("✅ File contents updated successfully", Colors.GREEN)
-            return True
-            
-        except Exception as e:
-            log(f"❌ Failed to update file contents: {e}", Colors.RED)
-            return False
-
-    def initialize_git_repository(self) -> bool:
-        """Initialize git repository and create initial commit"""
-        log("🔧 Initializing git repository", Colors.BLUE)
-        
-        try:
-            # Initialize git repo
-            if not run_command("git init", cwd=self.target_dir):
-                return False
-            
-            # Create .gitignore
-            gitignore_content = """# Python
+# .gitignore for generated projects, encoded once
+_GITIGNORE_BYTES = """# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -292,19 +185,207 @@ coverage/
 # Temporary files
 *.tmp
 temp.tmp
-"""
+""".encode('utf-8')
+
+# Template files whose executable bit must survive the copy
+_EXECUTABLE_NAMES = frozenset({'dev.js'})
+_EXECUTABLE_SUFFIXES = ('.sh', '.py')
+
+class ProjectScaffolder:
+    """Main scaffolding class"""
+    
+    def __init__(
+        self,
+        project_name: str,
+        description: str,
+        target_dir: str,
+        stream_output: bool = True
+    ):
+        self.project_name = project_name
+        self.description = description
+        self.target_dir = Path(target_dir).resolve()
+        # Stream pip's progress to the terminal; batch runs capture everything
+        # because several scaffolders share the same terminal
+        self.stream_output = stream_output
+        self.template_dir = Path(__file__).parent.resolve()
+        
+        # Derived names
+        self.snake_case_name = project_name.replace('-', '_')
+        self.title_case_name = project_name.replace('-', ' ').replace('_', ' ').title()
+        self.camel_case_name = self.title_case_name.replace(' ', '')
+        
+        # Files and directories to exclude from copying
+        self.exclude_patterns = {
+            '__pycache__',
+            '*.pyc',
+            '*.pyo',
+            '.git',
+            '.gitignore',
+            'venv',
+            'node_modules',
+            '.env',
+            '*.db',
+            'dist',
+            '.vite',
+            'temp.tmp',
+            'scaffold.py',  # Don't copy the scaffold script itself
+        }
+        # Split once into exact names and '*.ext'-style suffixes
+        self._exclude_names = frozenset(p for p in self.exclude_patterns if not p.startswith('*'))
+        self._exclude_suffixes = tuple(p[1:] for p in self.exclude_patterns if p.startswith('*'))
+        self._target_parent = str(self.target_dir.parent)
+        
+        # Files that need content replacement
+        self.template_files = [
+            'README.md',
+            'package.json',
+            'backend/requirements.txt',
+            'backend/render.yaml',
+            'frontend/package.json',
+            'frontend/wrangler.toml',
+            'frontend/index.html',
+            'frontend/src/App.jsx',
+            'backend/.env.example',
+            'frontend/.env.example',
+        ]
+
+        # Template tokens and their project-specific values
+        self._replacements = {
+            'starter-webapp': self.project_name,
+            'starter_webapp': self.snake_case_name,
+            'Starter Web App': self.title_case_name,
+            'Full-stack template with FastAPI + React': self.description,
+            'starter-webapp-frontend': f"{self.project_name}-frontend",
+            'starter-webapp-backend': f"{self.project_name}-backend",
+            'starter-webapp-db': f"{self.project_name}-db",
+        }
+        # Longest tokens first so e.g. 'starter-webapp-frontend' wins over 'starter-webapp'
+        self._replace_re = re.compile('|'.join(
+            re.escape(token) for token in sorted(self._replacements, key=len, reverse=True)
+        ))
+        # Aho-Corasick automaton matching all tokens in one scan, when available
+        self._automaton = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for token, value in self._replacements.items():
+                self._automaton.add_word(token, (len(token), value))
+            self._automaton.make_automaton()
+
+    def should_exclude(self, name: str) -> bool:
+        """Check if a file/directory name should be excluded"""
+        return name in self._exclude_names or name.endswith(self._exclude_suffixes)
+
+    def _ignore(self, directory: str, names: List[str]) -> set:
+        """copytree ignore callback for excluded files and the target directory"""
+        ignored = {name for name in names if self.should_exclude(name)}
+        # Never copy the target into itself when it lives inside the template
+        if directory == self._target_parent:
+            ignored.add(self.target_dir.name)
+        return ignored
+
+    @staticmethod
+    def _copy_file(src: str, dst: str) -> str:
+        """copytree copy function: contents only, plus mode for scripts"""
+        shutil.copyfile(src, dst)
+        name = os.path.basename(src)
+        if name in _EXECUTABLE_NAMES or name.endswith(_EXECUTABLE_SUFFIXES):
+            shutil.copymode(src, dst)
+        return dst
+
+    def copy_template_structure(self) -> bool:
+        """Copy the template directory structure to target location"""
+        log(f"📁 Copying template structure to {self.target_dir}", Colors.BLUE)
+        
+        try:
+            shutil.copytree(
+                self.template_dir,
+                self.target_dir,
+                ignore=self._ignore,
+                dirs_exist_ok=True,
+                copy_function=self._copy_file,
+            )
             
-            with open(self.target_dir / '.gitignore', 'w') as f:
-                f.write(gitignore_content)
+            log("✅ Template structure copied successfully", Colors.GREEN)
+            return True
             
-            # Add all files
-            if not run_command("git add .", cwd=self.target_dir):
-                return False
+        except Exception as e:
+            log(f"❌ Failed to copy template structure: {e}", Colors.RED)
+            return False
+
+    def _replace_tokens(self, content: str) -> Optional[str]:
+        """Replace all template tokens in content, or return None if it has none"""
+        if self._automaton is None:
+            if self._replace_re.search(content) is None:
+                return None
+            return self._replace_re.sub(lambda m: self._replacements[m.group(0)], content)
+        
+        # Order matches by start, longest first, then keep leftmost-longest non-overlapping ones
+        matches = sorted(
+            (end - length + 1, -length, value)
+            for end, (length, value) in self._automaton.iter(content)
+        )
+        if not matches:
+            return None
+        
+        parts = []
+        position = 0
+        for start, neg_length, value in matches:
+            if start < position:
+                continue
+            parts.append(content[position:start])
+            parts.append(value)
+            position = start - neg_length
+        parts.append(content[position:])
+        return ''.join(parts)
+
+    def update_file_contents(self) -> bool:
+        """Update template files with project-specific content"""
+        log("📝 Updating file contents with project information", Colors.BLUE)
+        
+        try:
+            for template_file in self.template_files:
+                file_path = self.target_dir / template_file
+                
+                # Read file content; open() reports a missing file itself, no extra stat needed
+                try:
+                    content = file_path.read_text(encoding='utf-8')
+                except FileNotFoundError:
+                    continue
+                
+                # Apply all replacements in a single pass, skipping files without tokens
+                content = self._replace_tokens(content)
+                if content is None:
+                    continue
+                
+                # Write updated content to a temp file and atomically swap it in
+                tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
+                tmp_path.write_text(content, encoding='utf-8')
+                os.replace(tmp_path, file_path)
+            
+            log("✅ File contents updated successfully", Colors.GREEN)
+            return True
+            
+        except Exception as e:
+            log(f"❌ Failed to update file contents: {e}", Colors.RED)
+            return False
+
+    def initialize_git_repository(self) -> bool:
+        """Initialize git repository and create initial commit"""
+        log("🔧 Initializing git repository", Colors.BLUE)
+        
+        try:
+            # Create .gitignore
+            (self.target_dir / '.gitignore').write_bytes(_GITIGNORE_BYTES)
             
-            # Create initial commit
+            # Initialize repo, add all files and create initial commit
             commit_message = f"Initial commit: {self.title_case_name}\n\nGenerated from starter-webapp template\n\n🤖 Generated with scaffold tool"
-            if not run_command(f'git commit -m "{commit_message}"', cwd=self.target_dir):
-                return False
+            for command in (
+                ["git", "init"],
+                ["git", "add", "."],
+                ["git", "commit", "-m", commit_message],
+            ):
+                if not run_command(command, cwd=self.target_dir):
+                    return False
             
             log("✅ Git repository initialized with initial commit", Colors.GREEN)
             return True
@@ -335,33 +416,14 @@ temp.tmp
             # Try to install dependencies (optional)
             log("📦 Installing dependencies (this may take a while)...", Colors.YELLOW)
             
-            # Backend dependencies
-            backend_dir = self.target_dir / 'backend'
-            if (backend_dir / 'requirements.txt').exists():
-                log("📦 Installing Python dependencies...", Colors.BLUE)
-                venv_success = run_command("python -m venv venv", cwd=backend_dir, check=False)
-                if venv_success:
-                    # Activate venv and install
-                    if sys.platform == "win32":
-                        activate_cmd = "venv\\Scripts\\activate && pip install --upgrade pip && pip install -r requirements.txt"
-                    else:
-                        activate_cmd = "source venv/bin/activate && pip install --upgrade pip && pip install -r requirements.txt"
-                    
-                    if run_command(activate_cmd, cwd=backend_dir, check=False):
-                        log("✅ Backend dependencies installed", Colors.GREEN)
-                    else:
-                        log("⚠️  Backend dependency installation failed (run manually)", Colors.YELLOW)
-                else:
-                    log("⚠️  Virtual environment creation failed", Colors.YELLOW)
-            
-            # Frontend dependencies
-            frontend_dir = self.target_dir / 'frontend'
-            if (frontend_dir / 'package.json').exists():
-                log("📦 Installing Node.js dependencies...", Colors.BLUE)
-                if run_command("npm install", cwd=frontend_dir, check=False):
-                    log("✅ Frontend dependencies installed", Colors.GREEN)
-                else:
-                    log("⚠️  Frontend dependency installation failed (run manually)", Colors.YELLOW)
+            # Backend and frontend installs are independent, so run them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                installs = [
+                    executor.submit(self._install_backend_dependencies),
+                    executor.submit(self._install_frontend_dependencies),
+                ]
+                for install in installs:
+                    install.result()
             
             return True
             
@@ -369,6 +431,45 @@ temp.tmp
             log(f"❌ Failed to set up development environment: {e}", Colors.RED)
             return False
 
+    def _install_backend_dependencies(self) -> None:
+        """Create the backend venv and install Python dependencies"""
+        backend_dir = self.target_dir / 'backend'
+        if not (backend_dir / 'requirements.txt').exists():
+            return
+        
+        log("📦 Installing Python dependencies...", Colors.BLUE)
+        venv_success = run_command([sys.executable, "-m", "venv", "venv"], cwd=backend_dir, check=False)
+        if not venv_success:
+            log("⚠️  Virtual environment creation failed", Colors.YELLOW)
+            return
+        
+        # Install with the venv's interpreter directly, no activate script needed
+        if sys.platform == "win32":
+            venv_python = backend_dir / 'venv' / 'Scripts' / 'python.exe'
+        else:
+            venv_python = backend_dir / 'venv' / 'bin' / 'python'
+        
+        install_cmd = [str(venv_python), "-m", "pip", "install", "-r", "requirements.txt"]
+        if run_command(install_cmd, cwd=backend_dir, capture=not self.stream_output):
+            log("✅ Backend dependencies installed", Colors.GREEN)
+        else:
+            log("⚠️  Backend dependency installation failed (run manually)", Colors.YELLOW)
+
+    def _install_frontend_dependencies(self) -> None:
+        """Install Node.js dependencies for the frontend"""
+        frontend_dir = self.target_dir / 'frontend'
+        if not (frontend_dir / 'package.json').exists():
+            return
+        
+        log("📦 Installing Node.js dependencies...", Colors.BLUE)
+        # Resolve npm explicitly since it is a .cmd shim on Windows
+        npm = shutil.which("npm") or "npm"
+        # npm runs alongside pip, so its output is captured and only shown on failure
+        if run_command([npm, "install"], cwd=frontend_dir):
+            log("✅ Frontend dependencies installed", Colors.GREEN)
+        else:
+            log("⚠️  Frontend dependency installation failed (run manually)", Colors.YELLOW)
+
     def create_project_summary(self) -> None:
         """Create a summary file with project information"""
         summary_content = f"""# {self.title_case_name}
@@ -379,7 +480,7 @@ temp.tmp
 
 - **Name**: {self.project_name}
 - **Description**: {self.description}
-- **Generated**: {subprocess.check_output(['date'], text=True).strip()}
+- **Generated**: {datetime.now().isoformat(timespec='seconds')}
 - **Template**: starter-webapp
 
 ## Quick Start
@@ -454,7 +555,10 @@ Happy coding! 🚀
         if self.target_dir.exists():
             if any(self.target_dir.iterdir()):
                 log(f"❌ Target directory is not empty: {self.target_dir}", Colors.RED)
-                response = input(f"{Colors.YELLOW}Continue anyway? (y/N): {Colors.RESET}")
+                # Only prompt on a terminal; scripted and batch runs never overwrite
+                response = ''
+                if sys.stdin.isatty():
+                    response = input(f"{Colors.YELLOW}Continue anyway? (y/N): {Colors.RESET}")
                 if response.lower() != 'y':
                     log("❌ Scaffolding cancelled", Colors.RED)
                     return False
@@ -514,6 +618,76 @@ Happy coding! 🚀
         
         log(f"\n🚀 {Colors.BOLD}Happy coding!{Colors.RESET}", Colors.GREEN)
 
+def _resolve_batch_entry(config: object) -> Optional[Tuple[str, str, str]]:
+    """Validate a batch config entry and return its (name, description, target)"""
+    if not isinstance(config, dict):
+        log(f"❌ Batch entry must be a {{name, description, target}} object: {config!r}", Colors.RED)
+        return None
+    
+    for key in ('name', 'description', 'target'):
+        value = config.get(key)
+        if value is not None and not isinstance(value, str):
+            log(f"❌ Batch entry field {key!r} must be a string: {value!r}", Colors.RED)
+            return None
+    
+    project_name = sanitize_name(config.get('name') or '')
+    if not validate_project_name(project_name):
+        log(f"❌ Invalid project name: {config.get('name')!r}", Colors.RED)
+        return None
+    
+    description = config.get('description') or DEFAULT_DESCRIPTION
+    target_dir = config.get('target') or f"./{project_name}"
+    return project_name, description, target_dir
+
+def _scaffold_one(entry: Tuple[str, str, str]) -> bool:
+    """Scaffold a single project from a validated batch entry"""
+    project_name, description, target_dir = entry
+    try:
+        scaffolder = ProjectScaffolder(
+            project_name, description, target_dir, stream_output=False
+        )
+        return scaffolder.scaffold()
+    except Exception as e:
+        log(f"❌ Unexpected error scaffolding {project_name}: {e}", Colors.RED)
+        return False
+
+def run_batch(config_path: str) -> bool:
+    """Scaffold every project listed in a JSON config file in parallel"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            configs = json.load(f)
+    except (OSError, ValueError) as e:
+        log(f"❌ Could not read batch config {config_path}: {e}", Colors.RED)
+        return False
+    
+    if not isinstance(configs, list):
+        log("❌ Batch config must be a JSON list of {name, description, target} objects", Colors.RED)
+        return False
+    
+    entries = [_resolve_batch_entry(config) for config in configs]
+    
+    # Parallel workers sharing a target would race past the non-empty check,
+    # so every entry whose resolved target collides with another is rejected
+    targets = Counter(Path(entry[2]).resolve() for entry in entries if entry)
+    for i, entry in enumerate(entries):
+        if entry and targets[Path(entry[2]).resolve()] > 1:
+            log(f"❌ Duplicate target directory for {entry[0]}: {entry[2]}", Colors.RED)
+            entries[i] = None
+    
+    valid = [entry for entry in entries if entry]
+    log(f"🚀 Scaffolding {len(valid)} of {len(configs)} projects", Colors.CYAN)
+    results = [False] * (len(entries) - len(valid))
+    if valid:
+        with ProcessPoolExecutor() as executor:
+            results.extend(executor.map(_scaffold_one, valid))
+    
+    failed = results.count(False)
+    if failed:
+        log(f"❌ {failed} of {len(configs)} projects failed", Colors.RED)
+        return False
+    log(f"🎉 All {len(configs)} projects created successfully", Colors.GREEN)
+    return True
+
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(
@@ -525,6 +699,7 @@ Examples:
   python scaffold.py --name my-awesome-app
   python scaffold.py --name blog-platform --description "A modern blogging platform"
   python scaffold.py --name ecommerce --target ../my-projects/ecommerce
+  python scaffold.py --batch projects.json
 
 The scaffold tool will:
 - Copy the template structure to a new directory
@@ -545,7 +720,7 @@ The scaffold tool will:
     parser.add_argument(
         '--description', '-d',
         help='Project description',
-        default='A full-stack web application built with FastAPI and React'
+        default=DEFAULT_DESCRIPTION
     )
     
     parser.add_argument(
@@ -560,12 +735,23 @@ The scaffold tool will:
         help='Skip dependency installation'
     )
     
+    parser.add_argument(
+        '--batch',
+        metavar='CONFIG',
+        help='JSON file with a list of {name, description, target} projects to scaffold in parallel',
+        default=None
+    )
+    
     args = parser.parse_args()
     
-    # Get project name
+    if args.batch:
+        sys.exit(0 if run_batch(args.batch) else 1)
+    
+    # Get project name (prompt only when attached to a terminal)
+    project_name = ''
     if args.name:
         project_name = args.name
-    else:
+    elif sys.stdin.isatty():
         project_name = input(f"{Colors.CYAN}Enter project name: {Colors.RESET}").strip()
     
     if not project_name:
@@ -587,7 +773,7 @@ The scaffold tool will:
     
     # Get description
     description = args.description
-    if not description or description == 'A full-stack web application built with FastAPI and React':
+    if (not description or description == DEFAULT_DESCRIPTION) and sys.stdin.isatty():
         user_description = input(f"{Colors.CYAN}Enter project description (optional): {Colors.RESET}").strip()
         if user_description:
             description = user_description
@@ -77,15 +77,21 @@ def compare_branches():
     
     print("\n=== Branch Comparison Report ===\n")
     
-    # Get local branches
-    local_branches = [ref.name for ref in local_repo.heads]
+    # Get local branches (enumerated once and reused below)
+    local_heads = {head.name: head for head in local_repo.heads}
+    local_branches = list(local_heads)
     
     # Get remote branches
-    remote_branches = []
+    remote_refs = {}
     try:
-        remote_branches = [ref.name.replace('origin/', '') for ref in local_repo.remotes.origin.refs if 'HEAD' not in ref.name]
+        remote_refs = {
+            ref.name.split('/', 1)[1]: ref
+            for ref in local_repo.remotes.origin.refs
+            if 'HEAD' not in ref.name
+        }
     except Exception as e:
         print(f"Warning: Could not get remote branches: {e}")
+    remote_branches = list(remote_refs)
     
     print("Local branches:")
     for branch in sorted(local_branches):
@@ -126,15 +132,12 @@ def compare_branches():
         print("Checking commit differences for common branches:")
         for branch_name in sorted(common_branches):
             try:
-                local_branch = local_repo.heads[branch_name]
-                remote_branch = local_repo.remotes.origin.refs[branch_name]
+                local_branch = local_heads[branch_name]
+                remote_branch = remote_refs[branch_name]
                 
-                # Count commits ahead/behind
-                ahead_commits = list(local_repo.iter_commits(f'{remote_branch}..{local_branch}'))
-                behind_commits = list(local_repo.iter_commits(f'{local_branch}..{remote_branch}'))
-                
-                ahead_count = len(ahead_commits)
-                behind_count = len(behind_commits)
+                # Count commits ahead/behind in a single rev-list call ("ahead\tbehind")
+                counts = local_repo.git.rev_list('--left-right', '--count', f'{local_branch}...{remote_branch}')
+                ahead_count, behind_count = (int(count) for count in counts.split())
                 
                 if ahead_count > 0 or behind_count > 0:
                     print(f"  {branch_name}:")
@@ -153,10 +156,8 @@ def compare_branches():
             print(f"\n=== GitHub Repository Info ===")
             print(f"Repository: {github_repo.full_name}")
             print(f"Default branch: {github_repo.default_branch}")
-            
-            # Get GitHub branches
-            github_branches = [branch.name for branch in github_repo.get_branches()]
-            print(f"Total GitHub branches: {len(github_branches)}")
+            # origin was just fetched with --prune, so it mirrors GitHub's branch list
+            print(f"Total origin branches: {len(remote_branches)}")
             
         except Exception as e:
             print(f"Could not fetch GitHub info: {e}")
@@ -167,10 +168,13 @@ def compare_branches():
         print("Checking if local-only branches have been merged to main:")
         
         try:
-            # Get the default/main branch
+            # Get the default/main branch from origin/HEAD, without an API call
             main_branch = 'main'
-            if github_repo:
-                main_branch = github_repo.default_branch
+            try:
+                main_branch = local_repo.git.symbolic_ref('--short', 'refs/remotes/origin/HEAD').split('/', 1)[1]
+            except Exception:
+                if github_repo:
+                    main_branch = github_repo.default_branch
             
             # Check if main branch exists locally
             if main_branch not in local_branches:
@@ -178,20 +182,12 @@ def compare_branches():
             else:
                 for branch_name in sorted(local_only):
                     try:
-                        # Check if branch has been merged into main
-                        main_commits = set(commit.hexsha for commit in local_repo.iter_commits(main_branch))
-                        branch_commits = set(commit.hexsha for commit in local_repo.iter_commits(branch_name))
-                        
-                        # If all branch commits are in main, it's been merged
-                        if branch_commits.issubset(main_commits):
-                            print(f"  {branch_name}: ✓ MERGED (safe to delete)")
+                        # Count commits the branch has beyond main; none means it's been merged
+                        unmerged_count = int(local_repo.git.rev_list('--count', f'{main_branch}..{branch_name}'))
+                        if unmerged_count:
+                            print(f"  {branch_name}: ✗ NOT MERGED ({unmerged_count} unique commits)")
                         else:
-                            # Check if branch is ahead of main
-                            unmerged_commits = list(local_repo.iter_commits(f'{main_branch}..{branch_name}'))
-                            if unmerged_commits:
-                                print(f"  {branch_name}: ✗ NOT MERGED ({len(unmerged_commits)} unique commits)")
-                            else:
-                                print(f"  {branch_name}: ✓ MERGED (safe to delete)")
+                            print(f"  {branch_name}: ✓ MERGED (safe to delete)")
                     except Exception as e:
                         print(f"  {branch_name}: Could not check merge status ({e})")
         except Exception as e:
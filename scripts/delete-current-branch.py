@@ -25,38 +25,61 @@ SQUASH MERGE DETECTION:
     - Safely handles cases where commits don't match due to squashing
 """
 
-import git
+import importlib.util
 import sys
 
 def get_repo():
     """Get the Git repository object."""
     try:
+        # Imported here so error paths before this point skip GitPython's startup cost
+        import git
         repo = git.Repo('.')
         return repo
     except Exception as e:
         print(f"Error: Could not access repository: {e}")
         return None
 
-def pull_main(repo):
-    """Pull latest changes from main branch."""
+def get_local_heads(repo):
+    """Return the current branch (None if detached) and a {branch: sha} dict of local heads."""
+    current_branch = None
+    heads = {}
+    # lstrip=2 always gives the bare branch name; refname:short turns into
+    # 'heads/<name>' when a tag shares the branch's name
+    output = repo.git.for_each_ref('--format=%(refname:lstrip=2) %(objectname) %(HEAD)', 'refs/heads/')
+    for line in output.splitlines():
+        # %(HEAD) is '*' for the checked-out branch and blank otherwise
+        name, sha, *marker = line.split()
+        heads[name] = sha
+        if marker:
+            current_branch = name
+    return current_branch, heads
+
+def write_commit_graph(repo):
+    """Enable and refresh the commit-graph so ancestry queries stay fast."""
+    # Make every git call from this process read the commit-graph
+    repo.git.update_environment(GIT_CONFIG_PARAMETERS="'core.commitGraph=true'")
+    try:
+        # Idempotent and incremental: only new commits are added on later runs
+        repo.git.commit_graph('write', '--reachable', '--changed-paths')
+    except Exception as e:
+        # Older git versions lack the commit-graph subcommand
+        print(f"Note: Could not write commit-graph: {e}")
+
+def pull_main(repo, heads):
+    """Update local main to match origin/main."""
     try:
         print("Pulling latest changes from main...")
         
-        # Fetch latest changes
-        repo.remotes.origin.fetch()
-        
         # Check if main branch exists locally
-        if 'main' not in [ref.name for ref in repo.heads]:
+        if 'main' not in heads:
             print("Error: 'main' branch not found locally")
             return False
-            
-        # Switch to main and pull
-        main_branch = repo.heads['main']
-        main_branch.checkout()
         
-        # Pull latest changes
-        repo.remotes.origin.pull('main')
-        print(" Successfully pulled latest changes from main")
+        # Fast-forward local main in place, without checking it out
+        repo.git.fetch('origin', 'main:main')
+        write_commit_graph(repo)
+        
+        print(" Successfully pulled latest changes from main")
         return True
         
     except Exception as e:
@@ -66,41 +89,36 @@ def pull_main(repo):
 def check_merge_status(repo, branch_name):
     """Check if the branch has been merged to main (handles squash and merge)."""
     try:
-        # For squash and merge workflows, we need to check if the remote branch exists
-        # If the remote branch has been deleted, it's likely been merged
+        # Check for unmerged commits (commits ahead of main) with a single rev-list count
+        unmerged_count = int(repo.git.rev_list('--count', f'main..{branch_name}'))
         
-        # First check if remote branch still exists
-        remote_branches = [ref.name.replace('origin/', '') for ref in repo.remotes.origin.refs if 'HEAD' not in ref.name]
-        remote_branch_exists = branch_name in remote_branches
-        
-        # Check for unmerged commits (commits ahead of main)
-        unmerged_commits = list(repo.iter_commits(f'main..{branch_name}'))
-        
-        if not unmerged_commits:
+        if unmerged_count == 0:
             # No commits ahead of main - safe to delete
             return True, "Branch has no commits ahead of main (safe to delete)"
         
+        # For squash and merge workflows, we need to check if the remote branch exists
+        # If the remote branch has been deleted, it's likely been merged
+        # Ask origin for just this ref (full name, since ls-remote patterns match on suffix)
+        remote_branch_exists = bool(repo.git.ls_remote('--heads', 'origin', f'refs/heads/{branch_name}').strip())
+        
         if not remote_branch_exists:
             # Remote branch deleted and we have local commits - likely squash merged
-            return True, f"Remote branch deleted, local has {len(unmerged_commits)} commits (likely squash merged)"
+            return True, f"Remote branch deleted, local has {unmerged_count} commits (likely squash merged)"
         
         # Remote branch exists and we have unmerged commits
-        if len(unmerged_commits) > 0:
-            # Check if this might be a squash merge scenario by examining commit messages
-            # Look for recent commits in main that might contain the branch name
-            recent_main_commits = list(repo.iter_commits('main', max_count=10))
-            branch_mentioned_in_main = any(
-                branch_name.replace('/', '-') in commit.message.lower() or 
-                branch_name.split('/')[-1] in commit.message.lower()
-                for commit in recent_main_commits
-            )
-            
-            if branch_mentioned_in_main:
-                return True, f"Branch likely squash merged (found reference in recent main commits)"
-            else:
-                return False, f"Branch has {len(unmerged_commits)} unmerged commits and remote branch exists"
+        # Check if this might be a squash merge scenario by examining commit messages
+        # Look for recent commits in main that might contain the branch name
+        # (one git call for the raw messages, no per-commit object parsing)
+        recent_messages = repo.git.log('main', '-n', '10', '--format=%B').lower()
+        branch_mentioned_in_main = (
+            branch_name.replace('/', '-').lower() in recent_messages or
+            branch_name.split('/')[-1].lower() in recent_messages
+        )
         
-        return True, "Branch appears to be merged"
+        if branch_mentioned_in_main:
+            return True, f"Branch likely squash merged (found reference in recent main commits)"
+        else:
+            return False, f"Branch has {unmerged_count} unmerged commits and remote branch exists"
                 
     except Exception as e:
         return False, f"Could not check merge status: {e}"
@@ -118,12 +136,12 @@ def delete_branch_interactive(repo, branch_name):
         if response in ['y', 'yes', '']:
             try:
                 # Delete the branch
-                repo.delete_head(branch_name, force=False)
+                repo.git.branch('-d', branch_name)
                 print(f" Successfully deleted branch '{branch_name}'")
                 
                 # Try to delete remote branch if it exists
                 try:
-                    repo.remotes.origin.push(f':refs/heads/{branch_name}')
+                    repo.git.push('origin', '--delete', branch_name)
                     print(f" Successfully deleted remote branch 'origin/{branch_name}'")
                 except Exception as e:
                     print(f"Note: Could not delete remote branch (may not exist): {e}")
@@ -143,10 +161,8 @@ def main():
     """Main function to orchestrate branch deletion."""
     print("=== Safe Branch Deletion Script ===\n")
     
-    # Check if required libraries are installed
-    try:
-        import git
-    except ImportError:
+    # Check if required libraries are installed (without importing them yet)
+    if importlib.util.find_spec('git') is None:
         print("Error: GitPython not installed.")
         print("Please install with: pip install GitPython")
         sys.exit(1)
@@ -156,11 +172,15 @@ def main():
     if not repo:
         sys.exit(1)
     
-    # Get current branch
+    # Get current branch and all local heads in one ref enumeration
     try:
-        current_branch = repo.active_branch.name
+        current_branch, heads = get_local_heads(repo)
     except Exception as e:
-        print(f"Error: Could not get current branch: {e}")
+        print(f"Error: Could not list local branches: {e}")
+        sys.exit(1)
+    
+    if current_branch is None:
+        print("Error: Could not get current branch")
         print("Make sure you're not in a detached HEAD state.")
         sys.exit(1)
     
@@ -172,25 +192,17 @@ def main():
         sys.exit(1)
     
     # Safety check: don't delete if there are uncommitted changes
-    if repo.is_dirty():
+    # (one status pass; untracked files are ignored, as with is_dirty())
+    if repo.git.status('--porcelain', '--untracked-files=no').strip():
         print("Error: You have uncommitted changes. Please commit or stash them first.")
         sys.exit(1)
     
     # Pull latest changes from main
-    if not pull_main(repo):
+    if not pull_main(repo, heads):
         print("Failed to pull latest changes from main. Aborting.")
         sys.exit(1)
     
-    # Switch back to the branch we want to delete to check merge status
-    try:
-        branch_to_delete = repo.heads[current_branch]
-        branch_to_delete.checkout()
-        print(f"Switched back to {current_branch} for merge verification")
-    except Exception as e:
-        print(f"Error switching back to branch: {e}")
-        sys.exit(1)
-    
-    # Check if branch has been merged
+    # Check if branch has been merged (compares refs directly, no checkout needed)
     is_merged, message = check_merge_status(repo, current_branch)
     
     print(f"\n=== Merge Status Check ===")
@@ -205,9 +217,9 @@ def main():
     
     print(f" Branch '{current_branch}' has been merged to main and is safe to delete.")
     
-    # Switch back to main before deletion
+    # Switch to main once, right before deletion
     try:
-        repo.heads['main'].checkout()
+        repo.git.checkout('main')
         print(f"Switched to main branch")
     except Exception as e:
         print(f"Error switching to main: {e}")